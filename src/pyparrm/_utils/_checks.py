@@ -0,0 +1,46 @@
+"""Tools for checking user inputs."""
+
+from multiprocessing import cpu_count
+
+
+def check_positive_number(value: int | float, name: str) -> None:
+    """Check that a value is an int or float greater than 0.
+
+    Parameters
+    ----------
+    value : int | float
+        Value to check.
+
+    name : str
+        Name of the value to use in error messages.
+    """
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"`{name}` must be an int or a float.")
+    if value <= 0:
+        raise ValueError(f"`{name}` must be > 0.")
+
+
+def check_n_jobs(n_jobs: int) -> int:
+    """Check the number of jobs and convert -1 to the number of CPUs.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of jobs to check. Must be <= the number of available CPUs and
+        > 0 (unless it is -1).
+
+    Returns
+    -------
+    n_jobs : int
+        The number of jobs, with -1 replaced by the number of available CPUs.
+    """
+    if not isinstance(n_jobs, int):
+        raise TypeError("`n_jobs` must be an int.")
+    if n_jobs > cpu_count():
+        raise ValueError("`n_jobs` must be <= the number of available CPUs.")
+    if n_jobs <= 0 and n_jobs != -1:
+        raise ValueError("If `n_jobs` is <= 0, it must be -1.")
+    if n_jobs == -1:
+        n_jobs = cpu_count()
+
+    return n_jobs
@@ -1,12 +1,12 @@
 """Tools for plotting results."""
 
 from copy import deepcopy
-from multiprocessing import cpu_count
 
 from matplotlib import pyplot as plt
 from matplotlib.widgets import RadioButtons, Slider
 import numpy as np
 
+from pyparrm._utils._checks import check_n_jobs
 from pyparrm._utils._power import compute_psd
 
 
@@ -117,17 +117,7 @@ class _ExploreParams:
             )
         self.freq_res = deepcopy(freq_res)
 
-        if not isinstance(n_jobs, int):
-            raise TypeError("`n_jobs` must be an int.")
-        if n_jobs > cpu_count():
-            raise ValueError(
-                "`n_jobs` must be <= the number of available CPUs."
-            )
-        if n_jobs <= 0 and n_jobs != -1:
-            raise ValueError("If `n_jobs` is <= 0, it must be -1.")
-        if n_jobs == -1:
-            n_jobs = cpu_count()
-        self.n_jobs = deepcopy(n_jobs)
+        self.n_jobs = check_n_jobs(n_jobs)
 
     def _initialise_parrm_data_info(self) -> None:
         """Initialise information from PARRM data for plotting."""
@@ -147,11 +137,9 @@ class _ExploreParams:
 
         # freq data info.
         n_freqs = int((self.parrm._sampling_freq // 2) // self.freq_res)
-        self.freqs = np.abs(
-            np.fft.fftfreq(n_freqs * 2, 1 / self.parrm._sampling_freq)[
-                1 : n_freqs + 1
-            ]
-        )
+        self.freqs = np.fft.rfftfreq(
+            n_freqs * 2, 1 / self.parrm._sampling_freq
+        )[1:]
         self.unfiltered_psds = compute_psd(
             self.parrm._data, self.parrm._sampling_freq, n_freqs, self.n_jobs
         )
@@ -1,7 +1,7 @@
 """Tools for computing signal power."""
 
 import numpy as np
-from scipy.fft import fft  # should be faster than numpy for real-val'd inputs
+from scipy.fft import rfft  # should be faster than numpy
 
 
 def compute_psd(
@@ -21,7 +21,9 @@ def compute_psd(
         How many frequencies the power spectra should be computed for.
 
     n_jobs : int (default 1)
-        Number of jobs to run in parallel.
+        Number of threads to use when computing the FFT. Passed to the
+        ``workers`` argument of :func:`scipy.fft.rfft`, so no processes are
+        spawned.
 
     Returns
     -------
@@ -35,12 +37,12 @@ def compute_psd(
     No checks on the inputs are performed for speed.
     Data is converted to, and power is returned as, float32 values for speed.
     """
-    fft_coeffs = fft(data.astype(np.float32), n_freqs * 2, workers=n_jobs)[
-        ..., 1 : n_freqs + 1
-    ]
-    psd = (1.0 / (sampling_freq * n_freqs * 2)) * np.abs(fft_coeffs).astype(
-        np.float32
-    ) ** 2
+    fft_coeffs = rfft(
+        data.astype(np.float32, copy=False), n_freqs * 2, workers=n_jobs
+    )[..., 1:]
+    psd = np.square(fft_coeffs.real)
+    psd += np.square(fft_coeffs.imag)
+    psd *= 1.0 / (sampling_freq * n_freqs * 2)
     psd[:-1] *= 2
 
     return psd
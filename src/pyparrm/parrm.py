@@ -1,15 +1,20 @@
 """Tools for fitting PARRM filters to data."""
 
 from copy import deepcopy
-from multiprocessing import cpu_count
+from functools import partial
 
 import numpy as np
 from pqdm.threads import pqdm
+from scipy.ndimage import convolve1d
 from scipy.optimize import fmin
-from scipy.signal import convolve2d
+from scipy.signal import fftconvolve, oaconvolve
 
+from pyparrm._utils._checks import check_n_jobs, check_positive_number
 from pyparrm._utils._plotting import _ExploreParams
 
+# filters with more taps than this are convolved in the frequency domain
+_MAX_DIRECT_CONVOLVE_TAPS = 64
+
 
 class PARRM:
     """Class for removing stimulation artefacts from data using PARRM.
@@ -28,7 +33,7 @@ class PARRM:
     ----------
     data : numpy.ndarray, shape of (channels, times)
         Time-series from which stimulation artefacts should be identified and
-        removed.
+        removed. Can be array-like if ``strict`` is ``False``.
 
     sampling_freq : int | float
         Sampling frequency of :attr:`data`, in Hz.
@@ -39,6 +44,11 @@ class PARRM:
     verbose : bool (default True)
         Whether or not to print information about the status of the processing.
 
+    strict : bool (default True)
+        Whether data given to the object must be a NumPy array. If ``False``,
+        array-like data (e.g. nested lists) is converted to a float64 NumPy
+        array.
+
     Methods
     -------
     find_period
@@ -65,6 +75,7 @@ class PARRM:
     _sampling_freq = None
     _artefact_freq = None
     _verbose = None
+    _strict = None
 
     _period = None
     _search_samples = None
@@ -78,6 +89,7 @@ class PARRM:
     _omit_n_samples = None
     _filter_direction = None
     _period_half_width = None
+    _filter_cache = None
 
     def __init__(
         self,
@@ -85,8 +97,11 @@ class PARRM:
         sampling_freq: int | float,
         artefact_freq: int | float,
         verbose: bool = True,
+        strict: bool = True,
     ) -> None:  # noqa D107
-        self._check_init_inputs(data, sampling_freq, artefact_freq, verbose)
+        self._check_init_inputs(
+            data, sampling_freq, artefact_freq, verbose, strict
+        )
         (self._n_chans, self._n_samples) = self._data.shape
 
     def _check_init_inputs(
@@ -95,24 +110,19 @@ class PARRM:
         sampling_freq: int | float,
         artefact_freq: int | float,
         verbose: bool,
+        strict: bool,
     ) -> None:
         """Check initialisation inputs to object."""
-        if not isinstance(data, np.ndarray):
-            raise TypeError("`data` must be a NumPy array.")
-        if data.ndim != 2:
-            raise ValueError("`data` must be a 2D array.")
-        self._data = data.copy()
+        if not isinstance(strict, bool):
+            raise TypeError("`strict` must be a bool.")
+        self._strict = deepcopy(strict)
+
+        self._data = self._as_data_array(data, copy=True)
 
-        if not isinstance(sampling_freq, (int, float)):
-            raise TypeError("`sampling_freq` must be an int or a float.")
-        if sampling_freq <= 0:
-            raise ValueError("`sampling_freq` must be > 0.")
+        check_positive_number(sampling_freq, "sampling_freq")
         self._sampling_freq = deepcopy(sampling_freq)
 
-        if not isinstance(artefact_freq, (int, float)):
-            raise TypeError("`artefact_freq` must be an int or a float.")
-        if artefact_freq <= 0:
-            raise ValueError("`artefact_freq` must be > 0.")
+        check_positive_number(artefact_freq, "artefact_freq")
         self._artefact_freq = deepcopy(artefact_freq)
 
         if not isinstance(verbose, bool):
@@ -189,6 +199,7 @@ class PARRM:
         self._omit_n_samples = None
         self._filter_direction = None
         self._period_half_width = None
+        self._filter_cache = None
 
     def _check_sort_find_stim_period_inputs(
         self,
@@ -236,10 +247,7 @@ class PARRM:
             )
         self._assumed_periods = deepcopy(assumed_periods)
 
-        if not isinstance(outlier_boundary, (int, float)):
-            raise TypeError("`outlier_boundary` must be an int or a float.")
-        if outlier_boundary <= 0:
-            raise ValueError("`outlier_boundary` must be > 0.")
+        check_positive_number(outlier_boundary, "outlier_boundary")
         self._outlier_boundary = deepcopy(outlier_boundary)
 
         if random_seed is not None and not isinstance(random_seed, int):
@@ -247,17 +255,7 @@ class PARRM:
         if random_seed is not None:
             self._random_seed = deepcopy(random_seed)
 
-        if not isinstance(n_jobs, int):
-            raise TypeError("`n_jobs` must be an int.")
-        if n_jobs > cpu_count():
-            raise ValueError(
-                "`n_jobs` must be <= the number of available CPUs."
-            )
-        if n_jobs <= 0 and n_jobs != -1:
-            raise ValueError("If `n_jobs` is <= 0, it must be -1.")
-        if n_jobs == -1:
-            n_jobs = cpu_count()
-        self._n_jobs = deepcopy(n_jobs)
+        self._n_jobs = check_n_jobs(n_jobs)
 
     def _standardise_data(self) -> None:
         """Take derivatives of data, set S.D. to 1, and clip outliers."""
@@ -428,25 +426,22 @@ class PARRM:
             Error of the fit between the data and the sinusoidal harmonics
             computed from the period.
         """
-        optimise_local_args = [
-            {
-                "period": period,
-                "data": self._standard_data,
-                "indices": indices,
-                "bandwidth": bandwidth,
-                "lambda_": lambda_,
-            }
-            for period in periods
-        ]
+        optimise_local = partial(
+            self._optimise_local,
+            data=self._standard_data[:, indices].T,
+            indices=indices,
+            bandwidth=bandwidth,
+            lambda_=lambda_,
+        )
         fit_error = np.array(
             pqdm(
-                optimise_local_args,
-                self._optimise_local,
+                periods,
+                optimise_local,
                 self._n_jobs,
-                argument_type="kwargs",
                 desc="Optimising period estimates",
                 disable=not self._verbose,
-            )
+            ),
+            dtype=np.float64,
         )
 
         min_fit_error_idcs = fit_error.argsort()
@@ -494,11 +489,12 @@ class PARRM:
             Period estimate corresponding to the smallest fit error.
         """
         n_iters = np.min((5, periods.shape[0]))
+        data = self._standard_data[:, indices].T
         fmin_args = [
             {
                 "func": self._optimise_local,
                 "x0": period,
-                "args": (self._standard_data, indices, bandwidth, lambda_),
+                "args": (data, indices, bandwidth, lambda_),
                 "full_output": True,
                 "disp": False,
             }
@@ -543,7 +539,7 @@ class PARRM:
             self._optimise_local,
             period,
             (
-                self._standard_data,
+                self._standard_data[:, indices].T,
                 indices,
                 bandwidth,
                 0.0,  # lambda
@@ -566,8 +562,10 @@ class PARRM:
         period : float
             Single estimate of the artefact period.
 
-        data : numpy.ndarray, shape of (channels, times)
-            Data containing artefacts whose period should be estimated.
+        data : numpy.ndarray, shape of (samples, channels)
+            Data containing artefacts whose period should be estimated, taken
+            at ``indices``. The samples are selected by the caller so that
+            they are not copied for every period evaluated.
 
         ...
 
@@ -582,21 +580,18 @@ class PARRM:
         ``period`` must be the first input argument for scipy.optimize.fmin to
         work on this function.
         """
-        fit_error = 0.0
-
         regu = np.arange(1, 2 * bandwidth + 2)
         regu = lambda_ * regu / regu.sum()
 
-        for data_chan in data:
-            residuals, beta = self._fit_waves_to_data(
-                data_chan[indices], indices, period, bandwidth
-            )
-            if isinstance(residuals, float):
-                return np.inf
+        residuals, beta = self._fit_waves_to_data(
+            data, indices, period, bandwidth
+        )
+        if isinstance(residuals, float):
+            return np.inf
 
-            fit_error += residuals.mean() + regu @ beta
+        fit_error = residuals.mean(axis=0) + regu @ beta
 
-        return fit_error / self._n_chans
+        return fit_error.sum() / self._n_chans
 
     def _fit_waves_to_data(
         self,
@@ -609,34 +604,46 @@ class PARRM:
 
         Parameters
         ----------
+        data : numpy.ndarray, shape of (samples, channels)
+            Data to fit the waves to. All channels are fit in a single solve,
+            as the sinusoidal harmonics are shared across channels.
+
         ...
 
         Returns
         -------
-        residuals : numpy.ndarray, shape of (samples)
+        residuals : numpy.ndarray, shape of (samples, channels)
             Squared residuals of the fit between between the data and the
             sinusoidal harmonics. A np.inf value is returned if the matrices
             are singular.
 
-        beta : numpy.ndarray, shape of (2 * `bandwidth` + 1, samples)
+        beta : numpy.ndarray, shape of (2 * `bandwidth` + 1, channels)
             Squared beta coefficient of the linear regression between the data
             and the sinusoidal harmonics. An np.inf value is returned if the
             matrices are singular.
         """
-        angles = (indices + 1) * (2 * np.pi / period)
+        # harmonics from powers of the fundamental phasor, avoiding separate
+        # sin and cos evaluations for every harmonic
+        phasors = np.exp(1j * (indices + 1) * (2 * np.pi / period))
+        harmonics = np.cumprod(
+            np.broadcast_to(phasors[:, None], (phasors.shape[0], bandwidth)),
+            axis=1,
+        )
         waves = np.ones((data.shape[0], 2 * bandwidth + 1))
-        for wave_idx in range(1, bandwidth + 1):
-            waves[:, 2 * wave_idx - 1] = np.sin(wave_idx * angles)
-            waves[:, 2 * wave_idx] = np.cos(wave_idx * angles)
+        waves[:, 1::2] = harmonics.imag
+        waves[:, 2::2] = harmonics.real
 
         try:  # ignores LinAlgError for singular matrices
             beta = np.linalg.solve(waves.T @ waves, waves.T @ data)
         except np.linalg.LinAlgError:
             return np.inf, np.inf
 
-        residuals = data - waves @ beta
+        residuals = waves @ beta
+        np.subtract(data, residuals, out=residuals)
+        np.square(residuals, out=residuals)
+        np.square(beta, out=beta)
 
-        return residuals**2, beta**2
+        return residuals, beta
 
     def explore_filter_params(
         self, freq_res: int | float = 5.0, n_jobs: int = 1
@@ -792,40 +799,74 @@ class PARRM:
         return filter_half_width
 
     def _generate_filter(self) -> None:
-        """Generate linear filter for removing stimulation artefacts."""
-        window = np.arange(
-            -self._filter_half_width, self._filter_half_width + 1
-        )
-        modulus = np.mod(window, self._period)
+        """Generate linear filter for removing stimulation artefacts.
 
-        filter_ = np.zeros_like(window, dtype=np.float64)
-        filter_[
-            (
-                (modulus <= self._period_half_width)
-                | (modulus >= self._period - self._period_half_width)
+        Filters are cached for the current period and filter settings, so
+        switching between filter directions does not regenerate them.
+        Filters for all directions share the same window, so they are
+        generated and cached together.
+        """
+        settings_key = (
+            self._period,
+            self._filter_half_width,
+            self._omit_n_samples,
+            self._period_half_width,
+        )
+        if self._filter_cache is None or self._filter_cache[0] != settings_key:
+            # only filters for the current settings are kept, so the cache
+            # cannot grow as settings change (e.g. in the parameter explorer)
+            self._filter_cache = (
+                settings_key,
+                self._generate_filters_all_directions(),
             )
-            & (np.abs(window) > self._omit_n_samples)
-        ] += 1.0
 
-        if self._filter_direction == "past":
-            filter_[window > 0] = 0
-        elif self._filter_direction == "future":
-            filter_[window <= 0] = 0
-
-        if np.all(filter_ == np.zeros_like(filter_)):
+        if self._filter_direction not in self._filter_cache[1]:
             raise RuntimeError(
                 "A suitable filter cannot be created with the specified "
                 "settings. Try reducing the number of omitted samples and/or "
                 "increasing the filter half-width."
             )
 
-        filter_ = -filter_ / np.max(
-            (filter_.sum(), np.finfo(filter_.dtype).eps)
+        self._filter = self._filter_cache[1][self._filter_direction]
+
+    def _generate_filters_all_directions(self) -> dict[str, np.ndarray]:
+        """Generate filters for all filter directions.
+
+        Returns
+        -------
+        filters : dict of str: numpy.ndarray
+            Filters for each direction, with the direction as the key.
+            Directions for which no samples lie in the window are omitted.
+        """
+        window = np.arange(
+            -self._filter_half_width, self._filter_half_width + 1
+        )
+        modulus = np.mod(window, self._period)
+
+        samples_used = (
+            (modulus <= self._period_half_width)
+            | (modulus >= self._period - self._period_half_width)
+        ) & (np.abs(window) > self._omit_n_samples)
+
+        directions = ("both", "past", "future")
+        direction_masks = np.array(
+            [np.ones_like(samples_used), window <= 0, window > 0]
         )
+        filters = (samples_used & direction_masks).astype(np.float64)
+        n_used = filters.sum(axis=1)
+
+        filters /= -np.maximum(n_used, np.finfo(filters.dtype).eps)[:, None]
 
-        filter_[window == 0] = 1
+        filters[:, window == 0] = 1
 
-        self._filter = filter_
+        # own allocation per filter, rather than a row view
+        return {
+            direction: filter_.copy()
+            for direction, filter_, n_direction_used in zip(
+                directions, filters, n_used
+            )
+            if n_direction_used > 0
+        }
 
     def filter_data(self, data: np.ndarray | None = None) -> np.ndarray:
         """Apply the PARRM filter to the data and return it.
@@ -836,7 +877,8 @@ class PARRM:
         Parameters
         ----------
         data : numpy.ndarray, shape of (channels, times) | None (default None)
-            The data to filter. If None, :attr:`data` is used.
+            The data to filter. If None, :attr:`data` is used. Can be
+            array-like if the object was created with ``strict=False``.
 
         Returns
         -------
@@ -854,30 +896,101 @@ class PARRM:
 
         data = self._check_sort_filter_data_inputs(data)
 
-        numerator = (
-            convolve2d(data.T, self._filter[:, np.newaxis], "same") - data.T
-        )
-        denominator = 1 - convolve2d(
-            np.ones_like(data).T,
-            self._filter[:, np.newaxis],
-            "same",
+        # filter response to a constant signal is shared across channels; it
+        # is convolved directly so samples with no filter support stay exact
+        denominator = 1 - convolve1d(
+            np.ones(data.shape[1]), self._filter, mode="constant"
         )
+        # build the filtered data in place in the convolution output buffer
+        filtered_data = self._convolve_filter(data)
+        filtered_data -= data
+        filtered_data[:, denominator == 0] = 0  # remove FFT round-off error
+        filtered_data /= denominator
+        filtered_data += data
 
-        self._filtered_data = (numerator / denominator + data.T).T
+        self._filtered_data = filtered_data
 
         if self._verbose:
             print("    ... Data filtered\n")
 
         return self._filtered_data
 
+    def _convolve_filter(self, data: np.ndarray) -> np.ndarray:
+        """Convolve the PARRM filter with the data along the time axis.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, shape of (channels, times)
+            Data to convolve with the filter.
+
+        Returns
+        -------
+        convolved_data : numpy.ndarray, shape of (channels, times)
+            Data convolved with the filter, centred on the input samples.
+
+        Notes
+        -----
+        Short filters are convolved directly in the time domain. Longer
+        filters are convolved in the frequency domain, using overlap-add when
+        the data is much longer than the filter.
+        """
+        # output must be floating point with the precision of the filter,
+        # whatever the data dtype
+        dtype = np.result_type(data, self._filter)
+        n_taps = self._filter.shape[0]
+        if n_taps <= _MAX_DIRECT_CONVOLVE_TAPS:
+            convolved_data = np.empty(data.shape, dtype=dtype)
+            convolve1d(
+                data,
+                self._filter,
+                axis=-1,
+                output=convolved_data,
+                mode="constant",
+            )
+            return convolved_data
+        data = data.astype(dtype, copy=False)
+        if data.shape[1] > 8 * n_taps:
+            return oaconvolve(data, self._filter[np.newaxis], "same", axes=-1)
+        return fftconvolve(data, self._filter[np.newaxis], "same", axes=-1)
+
     def _check_sort_filter_data_inputs(
         self, data: np.ndarray | None
     ) -> np.ndarray:
         """Check and sort `filter_data` inputs."""
         if data is None:
-            data = self.data
+            return self._data  # not modified, so no need to copy
+
+        return self._as_data_array(data, copy=False)
+
+    def _as_data_array(self, data: np.ndarray, copy: bool) -> np.ndarray:
+        """Check data is a 2D array, converting it if not in strict mode.
+
+        Parameters
+        ----------
+        data : numpy.ndarray | array-like, shape of (channels, times)
+            Data to check. Can only be array-like if :attr:`_strict` is
+            ``False``.
+
+        copy : bool
+            Whether a NumPy array must be copied. Converted array-like data
+            is never copied, as conversion already creates a new array.
+
+        Returns
+        -------
+        data : numpy.ndarray, shape of (channels, times)
+            The checked data.
+        """
         if not isinstance(data, np.ndarray):
-            raise TypeError("`data` must be a NumPy array.")
+            if self._strict:
+                raise TypeError("`data` must be a NumPy array.")
+            try:
+                data = np.asarray(data, dtype=np.float64)
+            except (TypeError, ValueError) as error:
+                raise TypeError(
+                    "`data` must be a NumPy array or array-like of numbers."
+                ) from error
+        elif copy:
+            data = data.copy()
         if data.ndim != 2:
             raise ValueError("`data` must be a 2D array.")
 
@@ -5,7 +5,7 @@ from multiprocessing import cpu_count
 import numpy as np
 import pytest
 
-from pyparrm import PARRM
+from pyparrm import PARRM, parrm as parrm_module
 from pyparrm._utils._power import compute_psd
 
 
@@ -88,6 +88,12 @@ def test_parrm_attrs():
     assert settings["filter"]["filter_direction"] == parrm._filter_direction
     assert settings["filter"]["period_half_width"] == parrm._period_half_width
 
+    settings["filter"]["filter_direction"] = "not_a_direction"
+    assert parrm.settings["filter"]["filter_direction"] == "both"
+
+    parrm.create_filter(filter_direction="past")
+    assert parrm.settings["filter"]["filter_direction"] == "past"
+
 
 def test_parrm_wrong_type_inputs():
     """Test that inputs of wrong types to PARRM are caught."""
@@ -123,6 +129,13 @@ def test_parrm_wrong_type_inputs():
             artefact_freq=artefact_freq,
             verbose=str(False),
         )
+    with pytest.raises(TypeError, match="`strict` must be a bool."):
+        PARRM(
+            data=data,
+            sampling_freq=sampling_freq,
+            artefact_freq=artefact_freq,
+            strict=str(True),
+        )
     parrm = PARRM(
         data=data,
         sampling_freq=sampling_freq,
@@ -351,6 +364,141 @@ def test_parrm_missing_filter_inputs():
     assert parrm._period_half_width is not None
 
 
+def _record_calls(func, calls: list):
+    """Wrap a function to record its name in `calls` when called."""
+
+    def wrapper(*args, **kwargs):
+        calls.append(func.__name__)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@pytest.mark.parametrize("filter_half_width", [10, 40])
+@pytest.mark.parametrize("filter_direction", ["both", "past", "future"])
+def test_parrm_filter_convolution_methods(
+    filter_half_width: int, filter_direction: str, monkeypatch
+):
+    """Test that direct and FFT-based filtering give the same results."""
+    data = random.rand(2, 1000)
+
+    parrm = PARRM(
+        data=data,
+        sampling_freq=sampling_freq,
+        artefact_freq=artefact_freq,
+        verbose=False,
+    )
+    parrm.find_period()
+    parrm.create_filter(
+        filter_half_width=filter_half_width,
+        filter_direction=filter_direction,
+        period_half_width=0.5,
+    )
+    n_taps = parrm.filter.shape[0]
+
+    fft_methods_used = []
+    for method in ["fftconvolve", "oaconvolve"]:
+        monkeypatch.setattr(
+            parrm_module,
+            method,
+            _record_calls(getattr(parrm_module, method), fft_methods_used),
+        )
+
+    # overlap-add used for data much longer than the filter
+    for test_data, fft_method in zip(
+        [data, data[:, : 4 * n_taps]], ["oaconvolve", "fftconvolve"]
+    ):
+        fft_methods_used.clear()
+        monkeypatch.setattr(parrm_module, "_MAX_DIRECT_CONVOLVE_TAPS", n_taps)
+        direct_filtered_data = parrm.filter_data(test_data)
+        assert fft_methods_used == []
+
+        monkeypatch.setattr(parrm_module, "_MAX_DIRECT_CONVOLVE_TAPS", 0)
+        fft_filtered_data = parrm.filter_data(test_data)
+        assert fft_methods_used == [fft_method]
+
+        assert np.allclose(
+            direct_filtered_data, fft_filtered_data, equal_nan=True
+        )
+        if filter_direction != "both":  # edges without filter support
+            assert np.isnan(fft_filtered_data).any()
+
+
+def test_parrm_non_strict_inputs():
+    """Test that PARRM accepts array-like data when not in strict mode."""
+    data = random.rand(1, 100)
+
+    parrm = PARRM(
+        data=data.tolist(),
+        sampling_freq=sampling_freq,
+        artefact_freq=artefact_freq,
+        verbose=False,
+        strict=False,
+    )
+    assert isinstance(parrm._data, np.ndarray)
+    assert np.all(data == parrm._data)
+
+    parrm.find_period()
+    parrm.create_filter()
+    other_data = random.rand(1, 50)
+    other_filtered_data = parrm.filter_data(other_data.tolist())
+    assert np.array_equal(
+        other_filtered_data, parrm.filter_data(other_data), equal_nan=True
+    )
+
+    with pytest.raises(ValueError, match="`data` must be a 2D array."):
+        parrm.filter_data(data=data[0].tolist())
+    with pytest.raises(
+        TypeError,
+        match="`data` must be a NumPy array or array-like of numbers.",
+    ):
+        parrm.filter_data(data=[[0.0, 1.0], [0.0]])
+
+
+def test_parrm_filter_cache():
+    """Test that PARRM filters are reused when switching direction."""
+    parrm = PARRM(
+        data=random.rand(1, 100),
+        sampling_freq=sampling_freq,
+        artefact_freq=artefact_freq,
+        verbose=False,
+    )
+    parrm.find_period()
+    parrm.create_filter(filter_direction="both")
+    both_filter = parrm._filter
+    parrm.create_filter(filter_direction="past")
+    assert parrm._filter is not both_filter
+    parrm.create_filter(filter_direction="both")
+    assert parrm._filter is both_filter
+
+    parrm.find_period()
+    assert parrm._filter_cache is None
+
+
+def test_parrm_filter_cache_bounded():
+    """Test that the PARRM filter cache does not grow with new settings."""
+    parrm = PARRM(
+        data=random.rand(1, 100),
+        sampling_freq=sampling_freq,
+        artefact_freq=artefact_freq,
+        verbose=False,
+    )
+    parrm.find_period()
+    previous_key = None
+    for period_half_width in np.linspace(parrm.period / 50, parrm.period, 50):
+        parrm.create_filter(period_half_width=float(period_half_width))
+        current_key = (
+            parrm._period,
+            parrm._filter_half_width,
+            parrm._omit_n_samples,
+            parrm._period_half_width,
+        )
+        # only the filters for the current settings are cached
+        assert parrm._filter_cache[0] == current_key
+        assert previous_key not in parrm._filter_cache
+        previous_key = current_key
+
+
 @pytest.mark.parametrize("n_chans", [1, 2])
 @pytest.mark.parametrize("n_jobs", [1, 2])
 def test_compute_psd(n_chans: int, n_jobs: int):
@@ -367,3 +515,26 @@ def test_compute_psd(n_chans: int, n_jobs: int):
 
     assert psd.shape == (n_chans, n_freqs)
     assert isinstance(psd, np.ndarray)
+
+
+def test_parrm_filter_integer_data():
+    """Test that integer data is filtered as floating point data."""
+    parrm = PARRM(
+        data=random.rand(1, 100),
+        sampling_freq=sampling_freq,
+        artefact_freq=artefact_freq,
+        verbose=False,
+    )
+    parrm.find_period()
+    parrm.create_filter(filter_half_width=10, period_half_width=0.5)
+    assert parrm.filter.shape[0] <= parrm_module._MAX_DIRECT_CONVOLVE_TAPS
+
+    int_data = random.randint(0, 100, (2, 200))
+    filtered_int_data = parrm.filter_data(int_data)
+
+    assert np.issubdtype(filtered_int_data.dtype, np.floating)
+    assert np.allclose(
+        filtered_int_data,
+        parrm.filter_data(int_data.astype(np.float64)),
+        equal_nan=True,
+    )